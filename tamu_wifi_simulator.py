@@ -8,6 +8,11 @@ Memory-efficient event-based architecture: <6MB RAM
 import pandas as pd
 import numpy as np
 import json
+import hashlib
+import inspect
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta
 from collections import defaultdict, namedtuple
 from typing import Iterator, Dict, List, Tuple
@@ -140,16 +145,143 @@ class BuildingProfile:
         return self.occupancy_pattern[hour]
 
 
+class ResultCache:
+    """Content-addressed on-disk cache for whole runs and per-hour results
+
+    Entries are JSON files named by the SHA-256 of the normalized building
+    config plus every simulation parameter, so identical inputs map to the
+    same entry regardless of which output file a run writes to. Reads touch
+    the entry's mtime; once the cache exceeds max_bytes the least recently
+    used entries are evicted.
+    """
+
+    VERSION = 1  # Bump when the cached result format changes
+    TMP_MAX_AGE = 10 * 60  # Seconds before an orphaned temp file is removed
+
+    def __init__(self, cache_dir: str = '.sim_cache', max_bytes: int = 64 * 1024 * 1024):
+        """Open (creating if needed) a cache; raises OSError if cache_dir is unusable"""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = {'run_hits': 0, 'run_misses': 0, 'hour_hits': 0, 'hour_misses': 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # mkstemp creates 0600 files; give entries the usual umask-derived mode
+        # so a cache dir shared between users or CI runners stays readable
+        umask = os.umask(0)
+        os.umask(umask)
+        self.file_mode = 0o666 & ~umask
+
+        self._evict()  # Enforce the size bound even if this run only hits
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Hash JSON-serializable parts into a stable hex digest"""
+        payload = json.dumps([ResultCache.VERSION, *parts], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{kind}-{key}.json")
+
+    def get(self, kind: str, key: str):
+        """Return cached value for (kind, key), or None on a miss"""
+        path = self._path(kind, key)
+        try:
+            with open(path, 'r') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.stats[f'{kind}_misses'] += 1
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        self.stats[f'{kind}_hits'] += 1
+        return value
+
+    def put(self, kind: str, key: str, value) -> None:
+        """Store value atomically, then evict LRU entries over the size bound"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(value, f, separators=(',', ':'))
+            os.chmod(tmp_path, self.file_mode)
+            os.replace(tmp_path, self._path(kind, key))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        # Other processes may share the dir and delete entries concurrently,
+        # so any file can vanish between listing, stat and remove
+        entries = []
+        total = 0
+        stale_before = time.time() - self.TMP_MAX_AGE
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    is_tmp = entry.name.endswith('.tmp')
+                    if not (is_tmp or entry.name.endswith('.json')):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    total += st.st_size
+                    if is_tmp:
+                        # Leftover from a writer killed before os.replace;
+                        # recent ones may still be in flight
+                        if st.st_mtime < stale_before:
+                            try:
+                                os.remove(entry.path)
+                                total -= st.st_size
+                            except OSError:
+                                pass
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # Already gone, or not ours to remove
+            total -= size
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"runs {s['run_hits']} hit / {s['run_misses']} miss, "
+                f"hours {s['hour_hits']} hit / {s['hour_misses']} miss")
+
+
 class WiFiSimulator:
     """Memory-efficient WiFi simulation using event streaming"""
 
-    def __init__(self, config_file: str = None, full_load: bool = True):
+    _code_fingerprint = None
+    _key_state = None  # (prefix, occupancy) memoized for the duration of a run
+
+    def __init__(self, config_file: str = None, full_load: bool = True,
+                 cache: ResultCache = None):
         self.buildings = []
         self.zones = {}
         self.total_clients = 90000  # Target 90,000 clients
         self.total_aps = 0
         self.simulation_date = datetime(2026, 2, 3)
         self.full_load = full_load
+        self.cache = cache
 
         if config_file:
             self.load_tamu_config(config_file)
@@ -303,13 +435,97 @@ class WiFiSimulator:
                 }
 
         return stats
-    
-    def run_simulation(self, output_file: str = 'tamu_simulation_output.json'):
-        """Run full 24-hour simulation with streaming output"""
-        print(f"\nStarting TAMU WiFi Simulation...")
-        print(f"  Target: {self.total_clients:,} clients ({self.total_clients * 3:,} devices)")
-        print(f"  Infrastructure: {int(self.total_aps)} Juniper AP47s across {len(self.zones)} zones")
-        
+
+    @classmethod
+    def code_fingerprint(cls) -> str:
+        """Hash of the source that turns keyed inputs into cached results
+
+        Part of every cache key, so editing these methods invalidates stale
+        entries without a manual version bump. If the source can't be read,
+        a per-process random token is used so entries are never reused
+        across runs that might be executing different code.
+        """
+        if cls._code_fingerprint is None:
+            sources = []
+            try:
+                for func in (cls.calculate_zone_statistics, cls.calculate_hourly_data,
+                             cls._build_results):
+                    sources.append(inspect.getsource(func))
+            except (OSError, TypeError):
+                sources = [os.urandom(16).hex()]
+            cls._code_fingerprint = hashlib.sha256('\n'.join(sources).encode('utf-8')).hexdigest()
+        return cls._code_fingerprint
+
+    def _key_inputs(self) -> Tuple[str, np.ndarray]:
+        """Digest of the inputs shared by every hour, plus the occupancy matrix
+
+        Hourly stats read only zone allocation, each building's zone, AP count
+        and capacity, and that hour's occupancy, so names, dates and other
+        hours' occupancy are left out of the per-hour prefix.
+        """
+        if self._key_state is not None:
+            return self._key_state
+
+        buildings = [[int(b.zone), b.ap_count, b.capacity] for b in self.buildings]
+        zones = [[int(zone), data['client_count']] for zone, data in self.zones.items()]
+        prefix = ResultCache.make_key(self.code_fingerprint(), self.total_clients,
+                                      self.full_load, zones, buildings)
+        if self.buildings:
+            occupancy = np.stack([b.occupancy_pattern for b in self.buildings]).astype('<f2')
+        else:
+            occupancy = np.zeros((0, 24), dtype='<f2')
+        return prefix, occupancy
+
+    def config_key(self, hour: int = None) -> str:
+        """Hash of the normalized building config and simulation parameters
+
+        With an hour, only the shared prefix and that hour's occupancy are
+        hashed, so editing one hour's pattern, renaming buildings or changing
+        the date leaves the other hours' entries reusable. Adding, removing
+        or resizing buildings changes every hour's distribution and key.
+        """
+        prefix, occupancy = self._key_inputs()
+        if hour is not None:
+            return ResultCache.make_key(prefix, hour, occupancy[:, hour].tobytes().hex())
+
+        names = [b.name for b in self.buildings]
+        zones = [
+            [int(zone), data['ap_count'], data['building_count']]
+            for zone, data in self.zones.items()
+        ]
+        return ResultCache.make_key(prefix, names, zones, int(self.total_aps),
+                                    self.simulation_date.isoformat(),
+                                    occupancy.tobytes().hex())
+
+    def calculate_hourly_data(self, hour: int) -> Dict:
+        """Build the hourly result record, reusing a cached copy when available"""
+        hour_key = None
+        if self.cache:
+            hour_key = self.config_key(hour)
+            cached = self.cache.get('hour', hour_key)
+            if cached is not None:
+                return cached
+
+        zone_stats = self.calculate_zone_statistics(hour)
+
+        hourly_data = {
+            'hour': hour,
+            'timestamp': f"{hour:02d}:00",
+            'zones': {str(k): v for k, v in zone_stats.items()},
+            'campus_total': {
+                'active_clients': sum(z['active_clients'] for z in zone_stats.values()),
+                'total_devices': sum(z['total_devices'] for z in zone_stats.values()),
+                'avg_zone_load': float(np.mean([z['avg_wap_load'] for z in zone_stats.values()])),
+                'max_zone_load': float(np.max([z['max_wap_load'] for z in zone_stats.values()]))
+            }
+        }
+
+        if hour_key:
+            self.cache.put('hour', hour_key, hourly_data)
+        return hourly_data
+
+    def _build_results(self) -> Dict:
+        """Compute metadata and all 24 hourly records"""
         results = {
             'metadata': {
                 'campus': 'Texas A&M University',
@@ -339,27 +555,44 @@ class WiFiSimulator:
         
         for hour in range(24):
             print(f"  Simulating hour {hour:02d}:00...")
-            
-            zone_stats = self.calculate_zone_statistics(hour)
-            
-            hourly_data = {
-                'hour': hour,
-                'timestamp': f"{hour:02d}:00",
-                'zones': {str(k): v for k, v in zone_stats.items()},
-                'campus_total': {
-                    'active_clients': sum(z['active_clients'] for z in zone_stats.values()),
-                    'total_devices': sum(z['total_devices'] for z in zone_stats.values()),
-                    'avg_zone_load': float(np.mean([z['avg_wap_load'] for z in zone_stats.values()])),
-                    'max_zone_load': float(np.max([z['max_wap_load'] for z in zone_stats.values()]))
-                }
-            }
-            
-            results['hourly_stats'].append(hourly_data)
-            del zone_stats
+            results['hourly_stats'].append(self.calculate_hourly_data(hour))
         
-        # Write results
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        return results
+
+    def run_simulation(self, output_file: str = 'tamu_simulation_output.json'):
+        """Run full 24-hour simulation with streaming output"""
+        print(f"\nStarting TAMU WiFi Simulation...")
+        print(f"  Target: {self.total_clients:,} clients ({self.total_clients * 3:,} devices)")
+        print(f"  Infrastructure: {int(self.total_aps)} Juniper AP47s across {len(self.zones)} zones")
+        
+        results = None
+        config_key = None
+        try:
+            if self.cache:
+                self._key_state = self._key_inputs()
+                config_key = self.config_key()
+                results = self.cache.get('run', config_key)
+                if results is not None:
+                    print(f"  Cache hit: reusing stored results ({config_key[:12]})")
+
+            if results is None:
+                results = self._build_results()
+                if self.cache:
+                    self.cache.put('run', config_key, results)
+        finally:
+            self._key_state = None
+
+        # Write results, skipping the rewrite when the file is already current
+        serialized = json.dumps(results, indent=2).encode('utf-8')
+        existing = None
+        try:
+            with open(output_file, 'rb') as f:
+                existing = f.read()
+        except OSError:
+            pass
+        if existing != serialized:
+            with open(output_file, 'wb') as f:
+                f.write(serialized)
         
         peak_hour_data = max(results['hourly_stats'], key=lambda h: h['campus_total']['active_clients'])
         
@@ -373,6 +606,8 @@ class WiFiSimulator:
         print(f"  Total Devices: {peak_hour_data['campus_total']['total_devices']:,}")
         print(f"  Avg WAP Load: {peak_hour_data['campus_total']['avg_zone_load']:.1f} devices/AP")
         print(f"  Max WAP Load: {peak_hour_data['campus_total']['max_zone_load']:.1f} devices/AP")
+        if self.cache:
+            print(f"Cache: {self.cache.summary()}")
         
         return results
 
@@ -390,10 +625,26 @@ def main():
                        help='All 90,000 clients active every hour (default: on)')
     parser.add_argument('--no-full-load', dest='full_load', action='store_false',
                        help='Use occupancy-based patterns instead of full load')
+    parser.add_argument('--cache-dir', type=str, default='.sim_cache',
+                       help='Directory for cached run and per-hour results')
+    parser.add_argument('--cache-max-mb', type=float, default=64,
+                       help='Evict least recently used cache entries above this size')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always recompute and do not read or write the cache')
 
     args = parser.parse_args()
 
-    simulator = WiFiSimulator(full_load=args.full_load)
+    if args.cache_max_mb <= 0:
+        parser.error('--cache-max-mb must be greater than 0')
+
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResultCache(args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+        except OSError as e:
+            print(f"Warning: result cache disabled ({e})")
+
+    simulator = WiFiSimulator(full_load=args.full_load, cache=cache)
     simulator.load_tamu_config(args.config)
     simulator.run_simulation(args.output)
 